@@ -0,0 +1,39 @@
+import os
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "whisper_transcriber")
+OV_CACHE_DIR = os.path.join(CACHE_DIR, "ov_cache")
+
+DEVICES = ("CPU", "GPU", "NPU")
+
+
+class OpenVINOWhisper:
+    """
+    Whisper running through openvino_genai.WhisperPipeline.
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+
+    def transcribe(self, audio: np.ndarray) -> list[tuple[float, float, str]]:
+        # Pass the float32 buffer itself: a Python list of the samples costs gigabytes on long videos.
+        result = self.pipeline.generate(np.ascontiguousarray(audio, dtype=np.float32), return_timestamps=True)
+        return [(chunk.start_ts, chunk.end_ts, chunk.text.strip()) for chunk in result.chunks]
+
+
+def load(model_name: str, device: str = "CPU") -> OpenVINOWhisper:
+    """
+    Load an OpenVINO-exported Whisper model directory on CPU, GPU or NPU.
+    Compiled blobs are kept in OV_CACHE_DIR, so later runs skip compilation.
+    """
+    try:
+        import openvino_genai
+    except ImportError:
+        raise RuntimeError("openvino-genai is not installed. Run: pip install openvino-genai") from None
+    if not os.path.isdir(model_name):
+        raise RuntimeError(
+            f"OpenVINO backend expects an exported model folder, got: {model_name}\n"
+            "Export one with: optimum-cli export openvino --model openai/whisper-base whisper-base-ov"
+        )
+    os.makedirs(OV_CACHE_DIR, exist_ok=True)
+    return OpenVINOWhisper(openvino_genai.WhisperPipeline(model_name, device, CACHE_DIR=OV_CACHE_DIR))
@@ -2,7 +2,8 @@ import os
 import sys
 import argparse
 import shutil
-from .core import process_video, get_device, VIDEO_EXTENSIONS
+from .backends.openvino import DEVICES as OV_DEVICES
+from .core import process_video, process_videos, process_videos_multi_gpu, find_videos_in_folder, is_video_file, get_device, cuda_device_count, load_model, BACKENDS, PYAV_AVAILABLE
 
 def get_ffmpeg_path() -> str:
     system_ffmpeg = shutil.which("ffmpeg")
@@ -20,28 +21,35 @@ def main():
     parser.add_argument("input", help="Path to video file or folder containing videos")
     parser.add_argument("--model", default="base", help="Whisper model to use (default: base)")
     parser.add_argument("--block", type=int, default=60, help="Block length in seconds (default: 60)")
+    parser.add_argument("--backend", choices=BACKENDS, default="openai", help="Inference backend: openai-whisper, faster-whisper or OpenVINO GenAI (default: openai)")
+    parser.add_argument("--compile", action="store_true", help="Compile the Whisper decoder with torch.compile (openai backend only)")
     parser.add_argument("--device", choices=["cpu", "cuda"], default=None, help="Device to use (default: auto)")
+    parser.add_argument("--ov-device", choices=OV_DEVICES, default="CPU", help="OpenVINO device for --backend openvino (default: CPU)")
+    parser.add_argument("--vad", action="store_true", help="Skip silence with Silero VAD before transcription")
     parser.add_argument("--format", nargs="+", choices=["docx", "txt", "pdf"], default=["docx"], help="Output format(s)")
     parser.add_argument("--all-formats", action="store_true", help="Save in all formats (docx, txt, pdf)")
 
     args = parser.parse_args()
-    device = get_device(args.device)
-    ffmpeg_path = get_ffmpeg_path()
+    if args.backend == "openvino" and args.device:
+        parser.error("--device does not apply to --backend openvino, use --ov-device instead")
+    device = args.ov_device if args.backend == "openvino" else get_device(args.device)
+    ffmpeg_path = None if PYAV_AVAILABLE else get_ffmpeg_path()
     formats = ["docx", "txt", "pdf"] if args.all_formats else args.format
 
-    if os.path.isfile(args.input) and args.input.lower().endswith(VIDEO_EXTENSIONS):
-        process_video(args.input, args.model, device, args.block, formats, ffmpeg_path)
+    if os.path.isfile(args.input) and is_video_file(args.input):
+        model = load_model(args.model, device, args.backend, args.compile)
+        process_video(args.input, model, args.block, formats, ffmpeg_path, vad=args.vad)
     elif os.path.isdir(args.input):
-        videos = []
-        for root, _, files in os.walk(args.input):
-            for f in files:
-                if f.lower().endswith(VIDEO_EXTENSIONS):
-                    videos.append(os.path.join(root, f))
+        videos = find_videos_in_folder(args.input)
         if not videos:
             print("No video files found in the folder.")
         else:
             print(f"Found {len(videos)} video file(s).")
-            for v in videos:
-                process_video(v, args.model, device, args.block, formats, ffmpeg_path)
+            n_gpus = cuda_device_count() if device == "cuda" else 0
+            if n_gpus > 1 and len(videos) > 1:
+                process_videos_multi_gpu(videos, args.model, args.backend, args.compile, args.block, formats, ffmpeg_path, n_gpus, vad=args.vad)
+            else:
+                model = load_model(args.model, device, args.backend, args.compile)
+                process_videos(videos, model, args.block, formats, ffmpeg_path, vad=args.vad)
     else:
         print("Error: provide a path to a video file or folder containing videos.")
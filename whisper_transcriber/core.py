@@ -1,25 +1,60 @@
+# Heavy dependencies (whisper, torch, docx, reportlab, av, faster_whisper) are imported
+# inside the functions that need them, so `--help` and TXT-only runs start quickly.
+from __future__ import annotations
+
+import importlib.util
+import multiprocessing
 import os
-import shutil
+import queue
 import subprocess
-import tempfile
-import whisper
-import torch
-from docx import Document
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+import numpy as np
+from .backends import openvino as openvino_backend
+
+if TYPE_CHECKING:
+    import torch
 
 VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv")
 
 FONT_PATH = os.path.join(os.path.dirname(__file__), "..", "fonts", "DejaVuSans.ttf")
 PDF_FONT = "Helvetica"
 
+BACKENDS = ("openai", "faster", "openvino")
+# openai-whisper folder runs decode clips of up to one 30 s window together, CLIP_BATCH_SIZE at a time.
+CLIP_BATCH_SECONDS = 30
+CLIP_BATCH_SIZE = 8
+# whisper.transcribe defaults, applied to batched clips so they match the per-file path.
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+HOP_LENGTH = 160
+TIME_PRECISION = 0.02
+SAMPLE_RATE = 16000
+# Multi-GPU runs split the videos into this many shares per GPU.
+SHARES_PER_GPU = 4
+PYAV_AVAILABLE = importlib.util.find_spec("av") is not None
+PDF_SINGLE_PARAGRAPH_LIMIT = 8 * 1024
+
+_MODEL_CACHE: dict[tuple[str, str, str, bool], object] = {}
+
+# (model, get_speech_timestamps) of Silero VAD, loaded on first use.
+_VAD = None
+
+# (block, title) paragraph styles for PDF output, built on first save_to_pdf call.
+_PDF_STYLES = None
+
 
 def register_font():
     """
     Register DejaVuSans font for PDF if available, otherwise fallback to Helvetica.
     """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
     global PDF_FONT
     if os.path.exists(FONT_PATH):
         try:
@@ -32,13 +67,33 @@ def register_font():
         print(f"[WARNING] Font not found at {FONT_PATH}, fallback to Helvetica")
 
 
-register_font()
+def _get_pdf_styles():
+    global _PDF_STYLES
+    if _PDF_STYLES is None:
+        from reportlab.lib.styles import ParagraphStyle
+
+        register_font()
+        _PDF_STYLES = (
+            ParagraphStyle(name="Cyrillic", fontName=PDF_FONT, fontSize=12, leading=14),
+            ParagraphStyle(name="CyrillicTitle", fontName=PDF_FONT, fontSize=16, leading=18, spaceAfter=12),
+        )
+    return _PDF_STYLES
+
+
+def _is_instance(obj, module_name: str, class_name: str) -> bool:
+    """
+    isinstance() against a class of an optional module, without importing it.
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(obj, getattr(module, class_name))
 
 
 def get_device(device_preference: str = None) -> str:
     """
     Detects which device should be used (CPU or CUDA).
     """
+    import torch
+
     if device_preference == "cuda" and torch.cuda.is_available():
         print("[INFO] Using CUDA (GPU)")
         return "cuda"
@@ -50,33 +105,168 @@ def get_device(device_preference: str = None) -> str:
     return device
 
 
-def extract_audio(video_path: str, audio_path: str, ffmpeg_path: str) -> str:
+def cuda_device_count() -> int:
     """
-    Extract audio from video using ffmpeg (16kHz mono WAV).
+    Number of visible CUDA devices (0 without CUDA).
+    """
+    import torch
+
+    return torch.cuda.device_count() if torch.cuda.is_available() else 0
+
+
+def extract_audio_pcm(video_path: str, ffmpeg_path: str, threads: int = None) -> np.ndarray:
+    """
+    Decode the audio track with ffmpeg straight into memory (16kHz mono float32).
+    threads is the ffmpeg decoder thread count (default: all CPU cores).
     """
     print(f"[INFO] Extracting audio from: {video_path}")
     command = [
-        ffmpeg_path, "-y", "-i", video_path,
-        "-ar", "16000", "-ac", "1", audio_path
+        ffmpeg_path, "-nostdin", "-loglevel", "error", "-nostats",
+        "-threads", str(threads or os.cpu_count() or 1), "-i", video_path,
+        "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"
     ]
-    subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    print(f"[INFO] Audio saved to: {audio_path}")
-    return audio_path
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+    data, _ = process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    audio = np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+    print(f"[INFO] Extracted {len(audio) / SAMPLE_RATE:.1f}s of audio")
+    return audio
 
 
-def transcribe_with_whisper(audio_path: str, model_name: str = "base", device: str = "cpu", block_seconds: int = 60) -> list[str]:
+def decode_to_np(video_path: str, threads: int = None) -> np.ndarray:
     """
-    Transcribe audio using Whisper and group text into time blocks.
+    Decode and resample the audio track in-process with PyAV (16kHz mono float32).
+    threads is the decoder thread count (default: all CPU cores).
     """
-    print(f"[INFO] Loading Whisper model: {model_name} on {device.upper()}")
-    model = whisper.load_model(model_name, device=device)
+    import av
 
-    print("[INFO] Starting transcription...")
-    result = model.transcribe(audio_path, verbose=False)
+    print(f"[INFO] Decoding audio from: {video_path}")
+    with av.open(video_path) as container:
+        if not container.streams.audio:
+            raise RuntimeError(f"No audio stream in {video_path}")
+        stream = container.streams.audio[0]
+        stream.thread_type = "AUTO"
+        stream.codec_context.thread_count = threads or os.cpu_count() or 1
+        if stream.duration is not None:
+            duration = float(stream.duration * stream.time_base)
+        else:
+            duration = (container.duration or 0) / av.time_base
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=SAMPLE_RATE)
+
+        buffer = np.empty(int(duration * SAMPLE_RATE) + SAMPLE_RATE, dtype=np.float32)
+        filled = 0
+
+        def write(frames):
+            nonlocal buffer, filled
+            for frame in frames:
+                samples = frame.to_ndarray().reshape(-1)
+                if filled + len(samples) > len(buffer):
+                    grown = np.empty(max(2 * len(buffer), filled + len(samples)), dtype=np.float32)
+                    grown[:filled] = buffer[:filled]
+                    buffer = grown
+                buffer[filled:filled + len(samples)] = samples
+                filled += len(samples)
+
+        for frame in container.decode(stream):
+            write(resampler.resample(frame))
+        write(resampler.resample(None))
+
+    print(f"[INFO] Extracted {filled / SAMPLE_RATE:.1f}s of audio")
+    return buffer[:filled]
+
+
+def extract_audio(video_path: str, ffmpeg_path: str = None, threads: int = None) -> np.ndarray:
+    """
+    Load the audio track as 16kHz mono float32, with PyAV when installed, otherwise via ffmpeg.
+    """
+    if PYAV_AVAILABLE:
+        return decode_to_np(video_path, threads)
+    return extract_audio_pcm(video_path, ffmpeg_path, threads)
+
+
+def load_model(model_name: str = "base", device: str = "cpu", backend: str = "openai", compile_decoder: bool = False):
+    """
+    Load a Whisper model once per (backend, model, device) and reuse it for later videos.
+    The "faster" backend uses faster-whisper (CTranslate2) with INT8 weights,
+    "openvino" loads an exported model folder on an OpenVINO device (CPU, GPU, NPU).
+    With compile_decoder the openai-whisper decoder is wrapped in torch.compile.
+    """
+    key = (backend, model_name, device, compile_decoder)
+    if key not in _MODEL_CACHE:
+        print(f"[INFO] Loading Whisper model: {model_name} on {device.upper()} ({backend} backend)")
+        if backend == "openvino":
+            _MODEL_CACHE[key] = openvino_backend.load(model_name, device)
+        elif backend == "faster":
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                raise RuntimeError("faster-whisper is not installed. Run: pip install faster-whisper") from None
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            _MODEL_CACHE[key] = WhisperModel(model_name, device=device, compute_type=compute_type)
+        else:
+            import torch
+            import whisper
 
+            # Allow TF32 tensor-core matmuls for any FP32 work left on Ampere+ GPUs.
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+            model = whisper.load_model(model_name, device=device)
+            if compile_decoder:
+                print("[INFO] Compiling Whisper decoder with torch.compile (first video will be slower)")
+                model.decoder = torch.compile(model.decoder, mode="reduce-overhead", fullgraph=False)
+            _MODEL_CACHE[key] = model
+    return _MODEL_CACHE[key]
+
+
+def _on_torch_cuda(model) -> bool:
+    return _is_instance(model, "torch.nn", "Module") and model.device.type == "cuda"
+
+
+def prefetch_to_device(audio: np.ndarray, device: torch.device, stream: torch.cuda.Stream) -> tuple[torch.Tensor, torch.cuda.Event]:
+    """
+    Start an asynchronous pinned host-to-device copy of audio on the given CUDA stream.
+    The returned event fires once the copy has finished.
+    """
+    import torch
+
+    pinned = torch.from_numpy(audio).pin_memory()
+    with torch.cuda.stream(stream):
+        tensor = pinned.to(device, non_blocking=True)
+        copied = torch.cuda.Event()
+        copied.record(stream)
+    return tensor, copied
+
+
+def run_model(model, audio: np.ndarray | torch.Tensor) -> list[tuple[float, float, str]]:
+    """
+    Run the loaded model and return (start, end, text) for every segment.
+    On CUDA the openai-whisper feature extraction runs on the GPU.
+    """
+    if isinstance(model, openvino_backend.OpenVINOWhisper):
+        return model.transcribe(audio)
+    if _is_instance(model, "faster_whisper", "WhisperModel"):
+        # Plain WhisperModel.transcribe leaves vad_filter off, so silence is only
+        # cropped when --vad asks for it, same as the other backends.
+        segments, _ = model.transcribe(audio, beam_size=1)
+        return [(seg.start, seg.end, seg.text.strip()) for seg in segments]
+    import torch
+
+    if _on_torch_cuda(model) and not torch.is_tensor(audio):
+        # Whisper computes the log-mel spectrogram on the input's device, so moving
+        # the waveform first keeps the STFT and mel filterbank on the GPU.
+        audio = torch.from_numpy(audio).to(model.device)
+    with torch.inference_mode():
+        result = model.transcribe(audio, verbose=False, fp16=model.device.type == "cuda")
+    return [(seg["start"], seg["end"], seg["text"].strip()) for seg in result["segments"]]
+
+
+def group_segments(segments: list[tuple[float, float, str]], block_seconds: int = 60) -> list[str]:
+    """
+    Group (start, end, text) segments into text blocks of at least block_seconds.
+    """
     blocks, current_text, block_start, last_end = [], [], None, None
-    for seg in result["segments"]:
-        start, end, text = seg["start"], seg["end"], seg["text"].strip()
+    for start, end, text in segments:
         if block_start is None:
             block_start = start
         current_text.append(text)
@@ -86,20 +276,154 @@ def transcribe_with_whisper(audio_path: str, model_name: str = "base", device: s
             current_text, block_start = [], None
     if current_text:
         blocks.append(f"[{block_start:.2f} - {last_end:.2f}] {' '.join(current_text)}")
+    return blocks
+
+
+def crop_to_speech(audio: np.ndarray) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """
+    Keep only the voiced parts of the audio, detected with Silero VAD.
+    Returns the cropped audio and the (cropped, original) start time in seconds of every kept span.
+    """
+    import torch
+
+    vad_model, get_speech_timestamps = _get_vad()
+    spans = get_speech_timestamps(torch.from_numpy(audio), vad_model, sampling_rate=SAMPLE_RATE)
+    if not spans:
+        print("[INFO] VAD found no speech")
+        return audio[:0], (np.zeros(1), np.zeros(1))
+    lengths = np.array([span["end"] - span["start"] for span in spans])
+    cropped_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) / SAMPLE_RATE
+    original_starts = np.array([span["start"] for span in spans]) / SAMPLE_RATE
+    cropped = np.concatenate([audio[span["start"]:span["end"]] for span in spans])
+    print(f"[INFO] VAD kept {len(cropped) / SAMPLE_RATE:.1f}s of {len(audio) / SAMPLE_RATE:.1f}s")
+    return cropped, (cropped_starts, original_starts)
+
+
+def _get_vad():
+    global _VAD
+    if _VAD is None:
+        import torch
+
+        print("[INFO] Loading Silero VAD")
+        vad_model, utils = torch.hub.load("snakers4/silero-vad", "silero_vad")
+        _VAD = (vad_model, utils[0])
+    return _VAD
+
+
+def remap_timestamps(segments: list[tuple[float, float, str]], speech_offsets: tuple[np.ndarray, np.ndarray]) -> list[tuple[float, float, str]]:
+    """
+    Map segment times on the VAD-cropped audio back to the original timeline.
+    """
+    if not segments:
+        return segments
+    cropped_starts, original_starts = speech_offsets
+
+    def to_original(times: np.ndarray, side: str) -> np.ndarray:
+        # Ends that fall exactly on a span boundary belong to the span before it.
+        span = np.clip(np.searchsorted(cropped_starts, times, side=side) - 1, 0, len(cropped_starts) - 1)
+        return original_starts[span] + (times - cropped_starts[span])
 
+    starts = to_original(np.array([seg[0] for seg in segments], dtype=np.float64), "right")
+    ends = to_original(np.array([seg[1] for seg in segments], dtype=np.float64), "left")
+    return [(float(start), float(end), seg[2]) for start, end, seg in zip(starts, ends, segments)]
+
+
+def transcribe_with_whisper(audio: np.ndarray | torch.Tensor, model, block_seconds: int = 60,
+                            speech_offsets: tuple[np.ndarray, np.ndarray] = None) -> list[str]:
+    """
+    Transcribe audio using a loaded Whisper model and group text into time blocks.
+    speech_offsets (from crop_to_speech) maps timestamps back to the uncropped video.
+    """
+    print("[INFO] Starting transcription...")
+    segments = run_model(model, audio) if len(audio) else []
+    if speech_offsets is not None:
+        segments = remap_timestamps(segments, speech_offsets)
+    blocks = group_segments(segments, block_seconds)
     print(f"[INFO] Transcription complete. Total blocks: {len(blocks)}")
     return blocks
 
 
+def _clip_segments(tokens: list[int], tokenizer, duration: float) -> list[tuple[float, float, str]] | None:
+    """
+    Split the tokens of one decoded 30 s window into (start, end, text) segments at
+    consecutive timestamp tokens, like whisper.transcribe. Returns None when the last
+    segment is unfinished, since transcribe would then decode a second window.
+    """
+    begin = tokenizer.timestamp_begin
+    is_timestamp = [token >= begin for token in tokens]
+    cuts = [i for i in range(1, len(tokens)) if is_timestamp[i - 1] and is_timestamp[i]]
+    if cuts:
+        if is_timestamp[-2:] != [False, True]:
+            return None
+        bounds = zip([0] + cuts, cuts + [len(tokens)])
+        parts = [((tokens[a] - begin) * TIME_PRECISION, (tokens[b - 1] - begin) * TIME_PRECISION, tokens[a:b])
+                 for a, b in bounds]
+    else:
+        timestamps = [token for token in tokens if token >= begin]
+        end = (timestamps[-1] - begin) * TIME_PRECISION if timestamps and timestamps[-1] != begin else duration
+        parts = [(0.0, end, tokens)]
+    return [
+        (start, end, "" if start == end else tokenizer.decode([t for t in part if t < tokenizer.eot]).strip())
+        for start, end, part in parts
+    ]
+
+
+def transcribe_clip_batch(clips: list[np.ndarray | torch.Tensor], model,
+                          language: str = None) -> list[list[tuple[float, float, str]] | None]:
+    """
+    Transcribe several clips of at most 30 s in one forward pass (openai-whisper only):
+    their log-mel spectrograms are stacked into a single batch for whisper.decode.
+    Without a language, multilingual models detect it per clip; English-only models use "en".
+    Returns (start, end, text) segments per clip, or None for clips that whisper.transcribe
+    would re-decode (temperature fallback or a second window); run those through run_model.
+    """
+    import torch
+    import whisper
+
+    mels = torch.stack([
+        whisper.log_mel_spectrogram(whisper.pad_or_trim(clip), model.dims.n_mels, device=model.device)
+        for clip in clips
+    ])
+    if not model.is_multilingual:
+        # .en models cannot detect a language, whisper.decode raises without one.
+        language = "en"
+    options = whisper.DecodingOptions(language=language, fp16=model.device.type == "cuda")
+    print(f"[INFO] Transcribing {len(clips)} short clips in one batch...")
+    with torch.inference_mode():
+        results = whisper.decode(model, mels, options)
+    # Timestamp tokens do not depend on the language, so one tokenizer serves the whole batch.
+    tokenizer = whisper.tokenizer.get_tokenizer(
+        model.is_multilingual, num_languages=model.num_languages, language=language, task="transcribe"
+    )
+    segments = []
+    for clip, result in zip(clips, results):
+        if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD:
+            segments.append([])  # silence, transcribe skips the window
+        elif result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or result.avg_logprob < LOGPROB_THRESHOLD:
+            segments.append(None)
+        else:
+            duration = len(clip) // HOP_LENGTH * HOP_LENGTH / SAMPLE_RATE
+            segments.append(_clip_segments(result.tokens, tokenizer, duration))
+    return segments
+
+
 def save_to_docx(blocks: list[str], output_path: str):
     """
     Save transcription blocks into a DOCX file.
     """
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
     print(f"[INFO] Saving DOCX to: {output_path}")
     doc = Document()
     doc.add_heading("Video Transcription", level=1)
-    for block in blocks:
-        doc.add_paragraph(block)
+    paragraphs = "".join(f'<w:p><w:r><w:t xml:space="preserve">{escape(block)}</w:t></w:r></w:p>' for block in blocks)
+    fragment = parse_xml(f"<w:body {nsdecls('w')}>{paragraphs}</w:body>")
+    body = doc.element.body
+    # Paragraphs must stay in front of the trailing <w:sectPr> section properties.
+    position = body.index(body.sectPr) if body.sectPr is not None else len(body)
+    body[position:position] = list(fragment)
     doc.save(output_path)
 
 
@@ -118,41 +442,259 @@ def save_to_pdf(blocks: list[str], output_path: str):
     """
     Save transcription blocks into a PDF file with proper font support.
     """
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+    block_style, title_style = _get_pdf_styles()
     print(f"[INFO] Saving PDF to: {output_path}")
     doc = SimpleDocTemplate(output_path)
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="Cyrillic", fontName=PDF_FONT, fontSize=12, leading=14))
-    styles.add(ParagraphStyle(name="CyrillicTitle", fontName=PDF_FONT, fontSize=16, leading=18, spaceAfter=12))
+    escaped = [escape(block) for block in blocks]
 
-    story = [Paragraph("Video Transcription", styles["CyrillicTitle"]), Spacer(1, 12)]
-    for block in blocks:
-        story.append(Paragraph(block, styles["Cyrillic"]))
-        story.append(Spacer(1, 8))
+    story = [Paragraph("Video Transcription", title_style), Spacer(1, 12)]
+    if sum(len(block) for block in escaped) <= PDF_SINGLE_PARAGRAPH_LIMIT:
+        story.append(Paragraph("<br/><br/>".join(escaped), block_style))
+    else:
+        for block in escaped:
+            story.append(Paragraph(block, block_style))
+            story.append(Spacer(1, 8))
 
     doc.build(story)
     print(f"[INFO] PDF saved: {output_path}")
 
 
-def process_video(video_path: str, model_name: str, device: str, block_seconds: int, formats: list[str], ffmpeg_path: str):
+def save_blocks(blocks: list[str], base_path: str, formats: list[str]):
+    """
+    Save transcription blocks next to the video in every requested format.
+    """
+    for fmt in formats:
+        if fmt == "docx":
+            save_to_docx(blocks, base_path + ".docx")
+        elif fmt == "txt":
+            save_to_txt(blocks, base_path + ".txt")
+        elif fmt == "pdf":
+            save_to_pdf(blocks, base_path + ".pdf")
+
+
+def process_video(video_path: str, model, block_seconds: int, formats: list[str], ffmpeg_path: str, vad: bool = False):
     """
     Process a single video: extract audio, transcribe, and save in requested formats.
+    With vad, silence is cut out before transcription.
     """
     print(f"\n=== Processing video: {video_path} ===")
-    temp_dir = tempfile.mkdtemp(prefix="whisper_audio_")
-    audio_file = os.path.join(temp_dir, "temp_audio.wav")
+    audio = extract_audio(video_path, ffmpeg_path)
+    speech_offsets = None
+    if vad:
+        audio, speech_offsets = crop_to_speech(audio)
+    blocks = transcribe_with_whisper(audio, model, block_seconds=block_seconds, speech_offsets=speech_offsets)
+    save_blocks(blocks, os.path.splitext(video_path)[0], formats)
+    print(f"[INFO] Finished processing: {video_path}")
+
+
+def is_video_file(name: str) -> bool:
+    """
+    Check a file name against VIDEO_EXTENSIONS (case-insensitive).
+    """
+    return name.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def find_videos_in_folder(folder: str) -> list[str]:
+    """
+    Recursively collect video files under a folder, skipping folders that cannot be read.
+    """
+    videos = []
+    try:
+        entries = os.scandir(folder)
+    except OSError as e:
+        print(f"[WARNING] Skipping unreadable folder {folder}: {e}")
+        return videos
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                videos.extend(find_videos_in_folder(entry.path))
+            elif is_video_file(entry.name) and entry.is_file():
+                videos.append(entry.path)
+    return videos
+
+
+def _put_until_stopped(q: queue.Queue, item, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def process_videos(videos: list[str], model, block_seconds: int, formats: list[str], ffmpeg_path: str, max_workers: int = None,
+                   vad: bool = False, cpus: int = None):
+    """
+    Process several videos as a pipeline:
+    extraction runs in parallel on a thread pool, a preparation thread crops silence (with vad)
+    and on CUDA copies the audio to the GPU on a side stream, and the calling thread transcribes.
+    At most two prepared tracks wait for the model, so memory stays bounded.
+    With openai-whisper, clips that fit in one 30 s window (and one block) are collected
+    and decoded together, CLIP_BATCH_SIZE files per forward pass.
+    cpus limits the cores used for decoding (default: all of them).
+    """
+    if not videos:
+        return
+    cpus = cpus or os.cpu_count() or 1
+    max_workers = max_workers or min(cpus, len(videos))
+    # Split the cores between concurrent decoders instead of oversubscribing them.
+    decoder_threads = max(1, cpus // max_workers)
+    extracted = queue.Queue(maxsize=max_workers)
+    ready = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    batch_clips = _is_instance(model, "torch.nn", "Module")
+    pending = []
+    copy_stream = None
+    if _on_torch_cuda(model):
+        import torch
+
+        copy_stream = torch.cuda.Stream(device=model.device)
+
+    def extract(video_path: str):
+        try:
+            item = (video_path, extract_audio(video_path, ffmpeg_path, decoder_threads))
+        except Exception as e:
+            item = (video_path, e)
+        _put_until_stopped(extracted, item, stop)
+
+    def prepare():
+        for _ in videos:
+            while True:
+                try:
+                    video_path, audio = extracted.get(timeout=0.5)
+                    break
+                except queue.Empty:
+                    if stop.is_set():
+                        return
+            speech_offsets, copied = None, None
+            if not isinstance(audio, Exception):
+                try:
+                    if vad:
+                        audio, speech_offsets = crop_to_speech(audio)
+                    if copy_stream is not None and len(audio):
+                        audio, copied = prefetch_to_device(audio, model.device, copy_stream)
+                except Exception as e:
+                    audio = e
+            _put_until_stopped(ready, (video_path, audio, speech_offsets, copied), stop)
+
+    def flush_clips():
+        decoded = transcribe_clip_batch([audio for _, audio, _ in pending], model)
+        for (video_path, audio, speech_offsets), segments in zip(pending, decoded):
+            if segments is None:
+                blocks = transcribe_with_whisper(audio, model, block_seconds=block_seconds, speech_offsets=speech_offsets)
+            else:
+                if speech_offsets is not None:
+                    segments = remap_timestamps(segments, speech_offsets)
+                blocks = group_segments(segments, block_seconds)
+            save_blocks(blocks, os.path.splitext(video_path)[0], formats)
+            print(f"[INFO] Finished processing: {video_path}")
+        pending.clear()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for video_path in videos:
+            executor.submit(extract, video_path)
+        preparer = threading.Thread(target=prepare, name="whisper-prepare", daemon=True)
+        preparer.start()
+        try:
+            for _ in videos:
+                video_path, audio, speech_offsets, copied = ready.get()
+                if isinstance(audio, Exception):
+                    print(f"[ERROR] Failed to load audio from {video_path}: {audio}")
+                    continue
+                if copied is not None:
+                    compute_stream = torch.cuda.current_stream(model.device)
+                    compute_stream.wait_event(copied)
+                    audio.record_stream(compute_stream)
+                duration = len(audio) / SAMPLE_RATE
+                print(f"\n=== Processing video: {video_path} ({duration:.1f}s) ===")
+                if batch_clips and 0 < duration <= min(CLIP_BATCH_SECONDS, block_seconds):
+                    pending.append((video_path, audio, speech_offsets))
+                    if len(pending) == CLIP_BATCH_SIZE:
+                        flush_clips()
+                    continue
+                blocks = transcribe_with_whisper(audio, model, block_seconds=block_seconds, speech_offsets=speech_offsets)
+                save_blocks(blocks, os.path.splitext(video_path)[0], formats)
+                print(f"[INFO] Finished processing: {video_path}")
+            if pending:
+                flush_clips()
+        finally:
+            stop.set()
+            executor.shutdown(cancel_futures=True)
+            preparer.join()
+
+
+def _gpu_worker(gpu_name: str, tasks, results, model_name: str, backend: str, compile_decoder: bool, block_seconds: int,
+                formats: list[str], ffmpeg_path: str, vad: bool, cpus: int):
+    """
+    Worker process pinned to one GPU: load the model once, report whether that worked,
+    then run the process_videos pipeline on shares of videos from the shared task queue
+    until the None sentinel, decoding on its part of the CPU cores.
+    """
+    os.environ["CUDA_VISIBLE_DEVICES"] = gpu_name
+    try:
+        model = load_model(model_name, "cuda", backend, compile_decoder)
+    except Exception as e:
+        results.put((gpu_name, f"{type(e).__name__}: {e}"))
+        return
+    results.put((gpu_name, None))
+    while (share := tasks.get()) is not None:
+        try:
+            process_videos(share, model, block_seconds, formats, ffmpeg_path, vad=vad, cpus=cpus)
+        except Exception as e:
+            print(f"[ERROR] Failed to process {', '.join(share)}: {e}")
+
+
+def process_videos_multi_gpu(videos: list[str], model_name: str, backend: str, compile_decoder: bool, block_seconds: int,
+                             formats: list[str], ffmpeg_path: str, n_gpus: int, vad: bool = False):
+    """
+    Spread videos over several GPUs: one worker process per GPU, each with its own model,
+    pulling the next share of videos from a shared queue as soon as it is free.
+    Several shares per GPU keep the load balanced and let working GPUs pick up
+    the shares of GPUs that failed to load the model.
+    Raises RuntimeError if the model cannot be loaded on any GPU.
+    """
+    n_workers = min(n_gpus, len(videos))
+    print(f"[INFO] Using {n_workers} GPUs")
+    ctx = multiprocessing.get_context("spawn")
+    # Keep any CUDA_VISIBLE_DEVICES restriction of the parent when assigning GPUs.
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    gpu_names = [name.strip() for name in visible.split(",")[:n_workers]] if visible else [str(i) for i in range(n_workers)]
+
+    tasks, results = ctx.Queue(), ctx.Queue()
+    share_size = -(-len(videos) // (n_workers * SHARES_PER_GPU))
+    for i in range(0, len(videos), share_size):
+        tasks.put(videos[i:i + share_size])
+    for _ in gpu_names:
+        tasks.put(None)
+    cpus = max(1, (os.cpu_count() or 1) // n_workers)
+    options = (model_name, backend, compile_decoder, block_seconds, formats, ffmpeg_path, vad, cpus)
+    workers = {name: ctx.Process(target=_gpu_worker, args=(name, tasks, results, *options)) for name in gpu_names}
+    for worker in workers.values():
+        worker.start()
+
     try:
-        extract_audio(video_path, audio_file, ffmpeg_path)
-        blocks = transcribe_with_whisper(audio_file, model_name=model_name, device=device, block_seconds=block_seconds)
-
-        base_path = os.path.splitext(video_path)[0]
-        for fmt in formats:
-            if fmt == "docx":
-                save_to_docx(blocks, base_path + ".docx")
-            elif fmt == "txt":
-                save_to_txt(blocks, base_path + ".txt")
-            elif fmt == "pdf":
-                save_to_pdf(blocks, base_path + ".pdf")
-
-        print(f"[INFO] Finished processing: {video_path}")
+        # Wait until every worker has either loaded its model or failed.
+        load_errors = {}
+        while len(load_errors) < len(workers):
+            try:
+                gpu_name, error = results.get(timeout=1)
+                load_errors[gpu_name] = error
+            except queue.Empty:
+                for gpu_name, worker in workers.items():
+                    if worker.exitcode is not None and gpu_name not in load_errors:
+                        load_errors[gpu_name] = f"worker exited with code {worker.exitcode}"
+        failed = {name: error for name, error in load_errors.items() if error is not None}
+        for gpu_name, error in failed.items():
+            print(f"[WARNING] GPU {gpu_name} is not used, model failed to load: {error}")
+        if len(failed) == len(workers):
+            raise RuntimeError(f"Could not load Whisper model on any GPU: {next(iter(failed.values()))}")
+        for worker in workers.values():
+            worker.join()
     finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        for worker in workers.values():
+            if worker.is_alive():
+                worker.terminate()
+        # Sentinels of failed workers are never read; don't block exit on flushing them.
+        tasks.cancel_join_thread()